@@ -10,10 +10,11 @@ Core principles:
   “””
 
 import random
+from array import array
+from itertools import accumulate
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Tuple, Set
-import math
+from typing import Dict, List, Optional, Tuple, Set
 
 class Monsoon(Enum):
 NORTHEAST = “northeast”
@@ -26,14 +27,14 @@ AGRICULTURAL = “agricultural”    # Resource production
 CULTURAL_CENTER = “cultural”     # Knowledge/religion hub
 TRADING_POST = “trading”         # Commercial specialization
 
-@dataclass
+@dataclass(slots=True)
 class Island:
 name: str
 island_type: IslandType
 navigation_skill: float  # 0.0 to 1.0
 trade_capacity: int
 cultural_influence: float
-connections: Set[str]  # Set of connected island names
+connections: int  # Bitmask of connected island indices
 
 ```
 def __post_init__(self):
@@ -46,7 +47,7 @@ def __post_init__(self):
         self.cultural_influence = max(0.6, self.cultural_influence)
 ```
 
-@dataclass
+@dataclass(slots=True)
 class Voyage:
 origin: str
 destination: str
@@ -55,6 +56,44 @@ monsoon_phase: Monsoon
 trade_goods: int
 cultural_exchange: bool
 
+# Route tables shared by every simulation (closer islands have higher success rates)
+
+_DISTANCE_MATRIX = {
+    ("malacca", "jakarta"): 0.8,
+    ("malacca", "palembang"): 0.9,
+    ("jakarta", "surabaya"): 0.9,
+    ("surabaya", "makassar"): 0.7,
+    ("makassar", "ternate"): 0.6,
+    ("brunei", "manila"): 0.7,
+    ("manila", "cebu"): 0.9,
+    ("jakarta", "banjarmasin"): 0.8,
+}
+_DISTANCE_MATRIX.update({(d, o): f for (o, d), f in list(_DISTANCE_MATRIX.items())})
+
+_NE_FAVORABLE = frozenset({
+    ("jakarta", "surabaya"), ("surabaya", "makassar"),
+    ("malacca", "jakarta"), ("palembang", "jakarta"),
+    ("brunei", "manila"), ("manila", "cebu")
+})
+_SW_FAVORABLE = frozenset({
+    ("surabaya", "jakarta"), ("makassar", "surabaya"),
+    ("jakarta", "malacca"), ("jakarta", "palembang"),
+    ("cebu", "manila"), ("manila", "brunei")
+})
+
+_MONSOONS = tuple(Monsoon)
+
+# Six-season monsoon year: each wind holds for two seasons, separated by calms
+_MONSOON_PHASES = (Monsoon.NORTHEAST, Monsoon.NORTHEAST, Monsoon.CALM,
+                   Monsoon.SOUTHWEST, Monsoon.SOUTHWEST, Monsoon.CALM)
+_MONSOON_INDEX = {monsoon: i for i, monsoon in enumerate(_MONSOONS)}
+
+# Favorable routes get 0.9, sailing against the monsoon gets 0.3
+_MONSOON_FACTOR = {
+    Monsoon.NORTHEAST: {**{(d, o): 0.3 for o, d in _NE_FAVORABLE}, **dict.fromkeys(_NE_FAVORABLE, 0.9)},
+    Monsoon.SOUTHWEST: {**{(d, o): 0.3 for o, d in _SW_FAVORABLE}, **dict.fromkeys(_SW_FAVORABLE, 0.9)},
+}
+
 class NusantaraSimulation:
 “””
 Simulates movement patterns in the Nusantara archipelago based on:
@@ -68,104 +107,114 @@ Simulates movement patterns in the Nusantara archipelago based on:
 def __init__(self):
     # Initialize archipelago with historically-inspired islands
     self.islands = {
-        "malacca": Island("malacca", IslandType.PORT_CITY, 0.9, 150, 0.8, set()),
-        "jakarta": Island("jakarta", IslandType.TRADING_POST, 0.7, 200, 0.6, set()),
-        "surabaya": Island("surabaya", IslandType.PORT_CITY, 0.8, 120, 0.5, set()),
-        "palembang": Island("palembang", IslandType.CULTURAL_CENTER, 0.6, 80, 0.9, set()),
-        "banjarmasin": Island("banjarmasin", IslandType.TRADING_POST, 0.7, 100, 0.4, set()),
-        "makassar": Island("makassar", IslandType.PORT_CITY, 0.8, 90, 0.7, set()),
-        "ternate": Island("ternate", IslandType.AGRICULTURAL, 0.5, 60, 0.8, set()),
-        "brunei": Island("brunei", IslandType.TRADING_POST, 0.6, 110, 0.5, set()),
-        "cebu": Island("cebu", IslandType.PORT_CITY, 0.7, 85, 0.6, set()),
-        "manila": Island("manila", IslandType.CULTURAL_CENTER, 0.6, 95, 0.8, set())
+        "malacca": Island("malacca", IslandType.PORT_CITY, 0.9, 150, 0.8, 0),
+        "jakarta": Island("jakarta", IslandType.TRADING_POST, 0.7, 200, 0.6, 0),
+        "surabaya": Island("surabaya", IslandType.PORT_CITY, 0.8, 120, 0.5, 0),
+        "palembang": Island("palembang", IslandType.CULTURAL_CENTER, 0.6, 80, 0.9, 0),
+        "banjarmasin": Island("banjarmasin", IslandType.TRADING_POST, 0.7, 100, 0.4, 0),
+        "makassar": Island("makassar", IslandType.PORT_CITY, 0.8, 90, 0.7, 0),
+        "ternate": Island("ternate", IslandType.AGRICULTURAL, 0.5, 60, 0.8, 0),
+        "brunei": Island("brunei", IslandType.TRADING_POST, 0.6, 110, 0.5, 0),
+        "cebu": Island("cebu", IslandType.PORT_CITY, 0.7, 85, 0.6, 0),
+        "manila": Island("manila", IslandType.CULTURAL_CENTER, 0.6, 95, 0.8, 0)
     }
     
     self.current_monsoon = Monsoon.NORTHEAST
     self.monsoon_cycle = 0
-    self.voyage_history: List[Voyage] = []
+    
+    # Voyage history is kept column-wise (one compact array per Voyage field,
+    # islands and monsoons stored by index); see the voyage_history property
+    self._voyage_origin = array("B")
+    self._voyage_destination = array("B")
+    self._voyage_success = array("B")
+    self._voyage_monsoon = array("B")
+    self._voyage_trade = array("l")
+    self._voyage_cultural = array("B")
     
     # Track network development
     self.established_routes: Set[Tuple[str, str]] = set()
     self.total_trade_volume = 0
     self.cultural_exchanges = 0
+    self._successful_voyage_count = 0
+    
+    # Islands never change skill or position, so the route-independent part of
+    # every voyage's success probability is fixed per monsoon
+    self._island_names = tuple(self.islands)
+    self._island_list = tuple(self.islands.values())
+    self._island_index = {name: i for i, name in enumerate(self._island_names)}
+    self._base_success = [
+        [[self.islands[origin].navigation_skill * 0.4 +
+          self.get_distance_factor(origin, destination) * 0.3 +
+          self.get_monsoon_factor(origin, destination, monsoon) * 0.3
+          for destination in self.islands]
+         for origin in self.islands]
+        for monsoon in _MONSOONS
+    ]
+    
+    # Bias towards islands with trade capacity for origins: 70% of voyages
+    # leave from a trading-focused island, the rest from any island
+    trading_islands = [name for name, island in self.islands.items() 
+                     if island.island_type in [IslandType.PORT_CITY, IslandType.TRADING_POST]]
+    self._origin_cum_weights = list(accumulate(
+        0.3 / len(self._island_names) +
+        (0.7 / len(trading_islands) if name in trading_islands else 0.0)
+        for name in self._island_names)) if trading_islands else None
+
+@property
+def current_monsoon(self) -> Monsoon:
+    """Current monsoon phase"""
+    return _MONSOONS[self._monsoon_idx]
+
+@current_monsoon.setter
+def current_monsoon(self, monsoon: Monsoon):
+    # Hot paths index per-monsoon tables by position rather than hashing
+    # the Enum member on every voyage
+    self._monsoon_idx = _MONSOON_INDEX[monsoon]
 
 def get_distance_factor(self, origin: str, destination: str) -> float:
     """Simplified distance calculation based on geographical knowledge"""
-    # Closer islands have higher success rates
-    distance_matrix = {
-        ("malacca", "jakarta"): 0.8,
-        ("malacca", "palembang"): 0.9,
-        ("jakarta", "surabaya"): 0.9,
-        ("surabaya", "makassar"): 0.7,
-        ("makassar", "ternate"): 0.6,
-        ("brunei", "manila"): 0.7,
-        ("manila", "cebu"): 0.9,
-        ("jakarta", "banjarmasin"): 0.8,
-    }
-    
-    # Check both directions
-    pair = (origin, destination)
-    reverse_pair = (destination, origin)
-    
-    return distance_matrix.get(pair, distance_matrix.get(reverse_pair, 0.4))
+    return _DISTANCE_MATRIX.get((origin, destination), 0.4)
 
-def get_monsoon_factor(self, origin: str, destination: str) -> float:
+def get_monsoon_factor(self, origin: str, destination: str,
+                       monsoon: Optional[Monsoon] = None) -> float:
     """Calculate monsoon favorability for specific routes"""
-    if self.current_monsoon == Monsoon.CALM:
+    if monsoon is None:
+        monsoon = self.current_monsoon
+    if monsoon == Monsoon.CALM:
         return 0.6  # Neutral conditions
     
-    # Northeast monsoon favors certain directions
-    if self.current_monsoon == Monsoon.NORTHEAST:
-        northeast_favorable = {
-            ("jakarta", "surabaya"), ("surabaya", "makassar"),
-            ("malacca", "jakarta"), ("palembang", "jakarta"),
-            ("brunei", "manila"), ("manila", "cebu")
-        }
-        if (origin, destination) in northeast_favorable:
-            return 0.9
-        elif (destination, origin) in northeast_favorable:
-            return 0.3  # Against monsoon
-    
-    # Southwest monsoon favors opposite directions
-    elif self.current_monsoon == Monsoon.SOUTHWEST:
-        southwest_favorable = {
-            ("surabaya", "jakarta"), ("makassar", "surabaya"),
-            ("jakarta", "malacca"), ("jakarta", "palembang"),
-            ("cebu", "manila"), ("manila", "brunei")
-        }
-        if (origin, destination) in southwest_favorable:
-            return 0.9
-        elif (destination, origin) in southwest_favorable:
-            return 0.3
-    
-    return 0.5  # Neutral
+    return _MONSOON_FACTOR[monsoon].get((origin, destination), 0.5)
 
 def calculate_voyage_success(self, origin: str, destination: str) -> float:
     """Calculate probability of successful voyage"""
-    origin_island = self.islands[origin]
-    dest_island = self.islands[destination]
-    
-    # Base factors
-    navigation_factor = origin_island.navigation_skill
-    distance_factor = self.get_distance_factor(origin, destination)
-    monsoon_factor = self.get_monsoon_factor(origin, destination)
+    return self._voyage_success_prob(self._island_index[origin],
+                                     self._island_index[destination])
+
+def _voyage_success_prob(self, origin_idx: int, dest_idx: int) -> float:
+    """Success probability for a voyage between two island indices"""
+    # Base factors (navigation, distance and monsoon) are precomputed
+    base_factor = self._base_success[self._monsoon_idx][origin_idx][dest_idx]
     
-    # Network effect - established routes are easier
-    route = (origin, destination)
-    reverse_route = (destination, origin)
-    network_bonus = 0.2 if route in self.established_routes or reverse_route in self.established_routes else 0.0
+    # Network effect - established routes are easier. Islands are connected
+    # exactly when a route between them was established in either direction
+    network_bonus = 0.2 if self._island_list[origin_idx].connections >> dest_idx & 1 else 0.0
     
     # Calculate final probability
-    success_prob = (navigation_factor * 0.4 + 
-                   distance_factor * 0.3 + 
-                   monsoon_factor * 0.3 + 
-                   network_bonus)
+    success_prob = base_factor + network_bonus
     
     return min(0.95, max(0.05, success_prob))
 
 def attempt_voyage(self, origin: str, destination: str) -> Voyage:
     """Attempt a voyage between two islands"""
-    success_prob = self.calculate_voyage_success(origin, destination)
+    success, trade_goods, cultural_exchange = self._attempt_voyage(
+        self._island_index[origin], self._island_index[destination])
+    
+    return Voyage(origin, destination, success, self.current_monsoon, 
+                  trade_goods, cultural_exchange)
+
+def _attempt_voyage(self, origin_idx: int, dest_idx: int) -> Tuple[bool, int, bool]:
+    """Attempt and record a voyage by island index, returning (success, trade, cultural)"""
+    success_prob = self._voyage_success_prob(origin_idx, dest_idx)
     success = random.random() < success_prob
     
     trade_goods = 0
@@ -173,19 +222,19 @@ def attempt_voyage(self, origin: str, destination: str) -> Voyage:
     
     if success:
         # Add route to established routes
-        route = (origin, destination)
+        route = (self._island_names[origin_idx], self._island_names[dest_idx])
         self.established_routes.add(route)
+        self._successful_voyage_count += 1
         
         # Connect islands
-        self.islands[origin].connections.add(destination)
-        self.islands[destination].connections.add(origin)
-        
-        # Generate trade based on island capabilities
-        origin_island = self.islands[origin]
-        dest_island = self.islands[destination]
+        origin_island = self._island_list[origin_idx]
+        dest_island = self._island_list[dest_idx]
+        origin_island.connections |= 1 << dest_idx
+        dest_island.connections |= 1 << origin_idx
         
+        # Generate trade based on island capabilities (uniform 20-100)
         trade_goods = min(origin_island.trade_capacity, 
-                        random.randint(20, 100))
+                        20 + int(random.random() * 81))
         self.total_trade_volume += trade_goods
         
         # Cultural exchange based on cultural influence
@@ -196,23 +245,28 @@ def attempt_voyage(self, origin: str, destination: str) -> Voyage:
         if cultural_exchange:
             self.cultural_exchanges += 1
     
-    voyage = Voyage(origin, destination, success, self.current_monsoon, 
-                   trade_goods, cultural_exchange)
-    self.voyage_history.append(voyage)
+    self._voyage_origin.append(origin_idx)
+    self._voyage_destination.append(dest_idx)
+    self._voyage_success.append(success)
+    self._voyage_monsoon.append(self._monsoon_idx)
+    self._voyage_trade.append(trade_goods)
+    self._voyage_cultural.append(cultural_exchange)
     
-    return voyage
+    return success, trade_goods, cultural_exchange
+
+@property
+def voyage_history(self) -> List[Voyage]:
+    """All voyages attempted so far, rebuilt from the columnar history"""
+    names = self._island_names
+    return [Voyage(names[o], names[d], bool(success), _MONSOONS[m], trade, bool(cultural))
+            for o, d, success, m, trade, cultural in zip(
+                self._voyage_origin, self._voyage_destination, self._voyage_success,
+                self._voyage_monsoon, self._voyage_trade, self._voyage_cultural)]
 
 def advance_monsoon(self):
     """Advance to next monsoon phase"""
     self.monsoon_cycle += 1
-    
-    if self.monsoon_cycle % 6 == 0:
-        self.current_monsoon = Monsoon.NORTHEAST
-    elif self.monsoon_cycle % 6 == 3:
-        self.current_monsoon = Monsoon.SOUTHWEST
-    elif self.monsoon_cycle % 6 in [2, 5]:
-        self.current_monsoon = Monsoon.CALM
-    # Other cycles stay in current monsoon
+    self.current_monsoon = _MONSOON_PHASES[self.monsoon_cycle % 6]
 
 def get_network_connectivity(self) -> float:
     """Calculate overall network connectivity"""
@@ -226,45 +280,39 @@ def get_island_centrality(self, island_name: str) -> float:
     island = self.islands[island_name]
     total_islands = len(self.islands)
     
-    return len(island.connections) / (total_islands - 1) if total_islands > 1 else 0
+    return island.connections.bit_count() / (total_islands - 1) if total_islands > 1 else 0
 
 def simulate_trading_season(self, num_voyages: int = 20) -> Dict:
     """Simulate a trading season with multiple voyages"""
-    season_voyages = []
-    island_names = list(self.islands.keys())
+    season_start = len(self._voyage_success)
     
-    for _ in range(num_voyages):
-        # Generate voyage based on realistic patterns
-        origin = random.choice(island_names)
-        
-        # Bias towards islands with trade capacity for origins
-        if random.random() < 0.7:  # 70% chance to pick trading-focused origin
-            trading_islands = [name for name, island in self.islands.items() 
-                             if island.island_type in [IslandType.PORT_CITY, IslandType.TRADING_POST]]
-            if trading_islands:
-                origin = random.choice(trading_islands)
-        
-        # Select destination (avoid same island)
-        possible_destinations = [name for name in island_names if name != origin]
-        destination = random.choice(possible_destinations)
-        
-        voyage = self.attempt_voyage(origin, destination)
-        season_voyages.append(voyage)
+    # Draw the whole season's routes up front; an offset of 1..N-1 from the
+    # origin selects a destination uniformly while avoiding the same island
+    num_islands = len(self._island_names)
+    origins = random.choices(range(num_islands), cum_weights=self._origin_cum_weights,
+                             k=num_voyages)
+    offsets = random.choices(range(1, num_islands), k=num_voyages)
+    
+    attempt_voyage = self._attempt_voyage
+    for origin_idx, offset in zip(origins, offsets):
+        attempt_voyage(origin_idx, (origin_idx + offset) % num_islands)
     
     # Advance monsoon
     self.advance_monsoon()
     
-    # Calculate season statistics
-    successful_voyages = [v for v in season_voyages if v.success]
-    season_trade = sum(v.trade_goods for v in successful_voyages)
-    season_cultural = sum(1 for v in successful_voyages if v.cultural_exchange)
+    # Calculate season statistics from this season's slice of the history;
+    # failed voyages carry no trade and no cultural exchange
+    total_voyages = len(self._voyage_success) - season_start
+    successful_voyages = sum(self._voyage_success[season_start:])
+    season_trade = sum(self._voyage_trade[season_start:])
+    season_cultural = sum(self._voyage_cultural[season_start:])
     
     return {
         "monsoon": self.current_monsoon.value,
         "cycle": self.monsoon_cycle,
-        "total_voyages": len(season_voyages),
-        "successful_voyages": len(successful_voyages),
-        "success_rate": len(successful_voyages) / len(season_voyages) if season_voyages else 0,
+        "total_voyages": total_voyages,
+        "successful_voyages": successful_voyages,
+        "success_rate": successful_voyages / total_voyages if total_voyages else 0,
         "trade_volume": season_trade,
         "cultural_exchanges": season_cultural,
         "network_connectivity": self.get_network_connectivity(),
@@ -293,15 +341,19 @@ def get_final_network_status(self) -> Dict:
     for name, island in self.islands.items():
         island_stats[name] = {
             "type": island.island_type.value,
-            "connections": len(island.connections),
+            "connections": island.connections.bit_count(),
             "centrality": self.get_island_centrality(name),
-            "connected_to": list(island.connections)
+            "connected_to": [other for i, other in enumerate(self._island_names)
+                             if island.connections >> i & 1]
         }
     
+    total_voyages = len(self._voyage_success)
+    successful_voyages = self._successful_voyage_count
+    
     return {
-        "total_voyages": len(self.voyage_history),
-        "successful_voyages": sum(1 for v in self.voyage_history if v.success),
-        "overall_success_rate": sum(1 for v in self.voyage_history if v.success) / len(self.voyage_history) if self.voyage_history else 0,
+        "total_voyages": total_voyages,
+        "successful_voyages": successful_voyages,
+        "overall_success_rate": successful_voyages / total_voyages if total_voyages else 0,
         "total_trade_volume": self.total_trade_volume,
         "total_cultural_exchanges": self.cultural_exchanges,
         "network_connectivity": self.get_network_connectivity(),